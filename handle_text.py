@@ -3,6 +3,78 @@
 import re
 import emoji
 
+# Sanitizer patterns, compiled once at import so each call skips the regex
+# cache lookup that re.sub pays for inline patterns.
+_HEADER_PATTERN = re.compile(r"^(#{1,6})\s+(.*)", re.MULTILINE)
+_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\([^\)]+\)")
+_INLINE_CODE_PATTERN = re.compile(r"`([^`]+)`")
+_EMPHASIS_PATTERN = re.compile(r"(\*\*|__|\*|_)")
+_CODE_BLOCK_PATTERN = re.compile(r"```([\s\S]+?)```")
+_IMAGE_PATTERN = re.compile(r"!\[([^\]]*)\]\([^\)]+\)")
+_HTML_TAG_PATTERN = re.compile(r"</?[^>]+(>|$)")
+_MULTI_NEWLINE_PATTERN = re.compile(r"\n{2,}")
+_MULTI_SPACE_PATTERN = re.compile(r" {2,}")
+
+# Optional Numba acceleration for the character-level whitespace pass.
+# Numba handles strings poorly, so the JIT'd kernel works on a uint8 buffer;
+# the regex passes above it are not JIT-able and stay in plain Python.
+try:
+    import numba
+    import numpy as np
+except ImportError:
+    numba = None
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _collapse_whitespace_jit(buf):
+        """Collapse runs of spaces to one and runs of newlines to two.
+
+        Operates on UTF-8 bytes; space and newline bytes never occur inside
+        multi-byte sequences, so byte-level scanning is safe.
+        """
+        out = np.empty(buf.shape[0], dtype=np.uint8)
+        length = buf.shape[0]
+        n = 0
+        i = 0
+        while i < length:
+            c = buf[i]
+            if c == 0x20:  # space
+                j = i
+                while j < length and buf[j] == 0x20:
+                    j += 1
+                out[n] = 0x20
+                n += 1
+                i = j
+            elif c == 0x0A:  # newline
+                j = i
+                while j < length and buf[j] == 0x0A:
+                    j += 1
+                out[n] = 0x0A
+                n += 1
+                if j - i >= 2:
+                    out[n] = 0x0A
+                    n += 1
+                i = j
+            else:
+                out[n] = c
+                n += 1
+                i += 1
+        return out[:n]
+
+    # Trigger compilation at import so the first request doesn't pay JIT cost.
+    _collapse_whitespace_jit(np.frombuffer(b" a\n\n\n  b", dtype=np.uint8))
+
+
+def _normalize_whitespace(text: str) -> str:
+    """Normalize paragraph breaks and repeated spaces, JIT'd when Numba is present."""
+    if numba is not None:
+        buf = np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+        return bytes(_collapse_whitespace_jit(buf)).decode("utf-8")
+
+    text = _MULTI_NEWLINE_PATTERN.sub('\n\n', text)  # Ensure consistent paragraph separation
+    return _MULTI_SPACE_PATTERN.sub(' ', text)
+
+
 def prepare_tts_input_with_context(text: str) -> str:
     """
     Prepares text for a TTS API by cleaning Markdown and adding minimal contextual hints
@@ -29,34 +101,31 @@ def prepare_tts_input_with_context(text: str) -> str:
         else:
             return f"Subsection — {header_text}\n"
 
-    text = re.sub(r"^(#{1,6})\s+(.*)", header_replacer, text, flags=re.MULTILINE)
+    text = _HEADER_PATTERN.sub(header_replacer, text)
 
     # Announce links (currently commented out for potential future use)
     # text = re.sub(r"\[([^\]]+)\]\((https?:\/\/[^\)]+)\)", r"\1 (link: \2)", text)
 
     # Remove links while keeping the link text
-    text = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", text)
+    text = _LINK_PATTERN.sub(r"\1", text)
 
     # Describe inline code
-    text = re.sub(r"`([^`]+)`", r"code snippet: \1", text)
+    text = _INLINE_CODE_PATTERN.sub(r"code snippet: \1", text)
 
     # Remove bold/italic symbols but keep the content
-    text = re.sub(r"(\*\*|__|\*|_)", '', text)
+    text = _EMPHASIS_PATTERN.sub('', text)
 
     # Remove code blocks (multi-line) with a description
-    text = re.sub(r"```([\s\S]+?)```", r"(code block omitted)", text)
+    text = _CODE_BLOCK_PATTERN.sub(r"(code block omitted)", text)
 
     # Remove image syntax but add alt text if available
-    text = re.sub(r"!\[([^\]]*)\]\([^\)]+\)", r"Image: \1", text)
+    text = _IMAGE_PATTERN.sub(r"Image: \1", text)
 
     # Remove HTML tags
-    text = re.sub(r"</?[^>]+(>|$)", '', text)
-
-    # Normalize line breaks
-    text = re.sub(r"\n{2,}", '\n\n', text)  # Ensure consistent paragraph separation
+    text = _HTML_TAG_PATTERN.sub('', text)
 
-    # Replace multiple spaces within lines
-    text = re.sub(r" {2,}", ' ', text)
+    # Normalize line breaks and repeated spaces within lines
+    text = _normalize_whitespace(text)
 
     # Trim leading and trailing whitespace from the whole text
     text = text.strip()
@@ -1,6 +1,6 @@
 # server.py
 
-from flask import after_this_request, Flask, request, send_file, jsonify, Response
+from flask import Flask, request, send_file, jsonify, Response
 from gevent.pywsgi import WSGIServer
 from dotenv import load_dotenv
 import os
@@ -11,7 +11,11 @@ import base64
 
 from config import DEFAULT_CONFIGS
 from handle_text import prepare_tts_input_with_context
-from subtitle_handler import DEFAULT_WORKERS, parse_srt_content, render_subtitles_to_zip
+from subtitle_handler import (
+    DEFAULT_WORKERS,
+    parse_srt_content,
+    render_subtitles_to_zip_stream,
+)
 from tts_handler import generate_speech, generate_speech_stream, get_models_formatted, get_voices, get_voices_formatted
 from utils import getenv_bool, require_api_key, AUDIO_FORMAT_MIME_TYPES, DETAILED_ERROR_LOGGING
 
@@ -205,8 +209,11 @@ def subtitles_to_speech():
     sanitize_text = request.values.get('sanitize', str(not REMOVE_FILTER)).lower() in ("1", "true", "yes")
     max_workers = int(request.values.get('max_workers', DEFAULT_WORKERS))
 
+    # Stream the archive straight to the client: no temp zip touches disk and
+    # entries go out as rendering produces them. A failure once streaming has
+    # begun aborts the transfer, which clients see as a truncated download.
     try:
-        zip_path, clip_count = render_subtitles_to_zip(
+        zip_stream, clip_count = render_subtitles_to_zip_stream(
             subtitles,
             voice,
             response_format,
@@ -217,20 +224,14 @@ def subtitles_to_speech():
     except Exception as exc:
         return jsonify({"error": f"Subtitle rendering failed: {exc}"}), 500
 
-    @after_this_request
-    def cleanup(response):
-        try:
-            os.unlink(zip_path)
-        except OSError:
-            pass
-        return response
-
-    return send_file(
-        zip_path,
+    return Response(
+        zip_stream,
         mimetype='application/zip',
-        as_attachment=True,
-        download_name='subtitle_audio.zip',
-        headers={"X-Clip-Count": str(clip_count), "X-Max-Workers": str(max_workers)},
+        headers={
+            "Content-Disposition": "attachment; filename=subtitle_audio.zip",
+            "X-Clip-Count": str(clip_count),
+            "X-Max-Workers": str(max_workers),
+        },
     )
 
 """
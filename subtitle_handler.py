@@ -2,93 +2,735 @@
 
 from __future__ import annotations
 
+import asyncio
+import itertools
 import os
+import queue
+import re
+import shutil
+import struct
+import sys
 import tempfile
+import threading
+import time
 import zipfile
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+from datetime import timedelta
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import srt
 
+# Optional libdeflate bindings (pypi "deflate"). Whole-buffer compression is
+# roughly twice as fast as the streaming zlib implementation behind zipfile,
+# which dominates CPU time when archiving many short clips.
+try:
+    import deflate
+except ImportError:  # pragma: no cover - optional dependency
+    deflate = None
+
 from handle_text import prepare_tts_input_with_context
-from tts_handler import generate_speech
+from tts_handler import NATIVE_FORMAT, generate_speech_bytes_batch_async, transcode_clips
 from utils import DETAILED_ERROR_LOGGING
 
-# Allow the worker count to be configured via env var while providing
-# a sensible default for multi-request, multi-segment workloads.
+# Bound on concurrently in-flight TTS streams; each subtitle line holds one
+# slot while its audio renders, regardless of how lines are batched.
+# Configurable via env var; a single event loop handles them, so this can be
+# raised well past the core count for network-bound workloads.
 DEFAULT_WORKERS = int(os.getenv("SUBTITLE_WORKERS", os.cpu_count() or 4))
 
+# Text sanitation is pure-Python CPU work (regex, normalization); running it
+# on the event loop would serialize it behind the GIL. A process pool lets it
+# parallelize across cores instead.
+SUBTITLE_CPU_WORKERS = int(os.getenv("SUBTITLE_CPU_WORKERS", os.cpu_count() or 4))
+
+# Subtitles are submitted to the TTS layer in chunks of this size so the
+# per-call dispatch overhead is paid once per chunk rather than once per line.
+BATCH_SIZE = int(os.getenv("SUBTITLE_BATCH_SIZE", 16))
+
+# SRT files routinely repeat lines ("Yes.", character names, narration tags),
+# and re-synthesizing an identical line wastes a TTS call. Finished clips are
+# kept in a bounded LRU keyed on the sanitized text plus render parameters;
+# eviction unlinks the backing file so disk usage stays capped.
+CLIP_CACHE_SIZE = int(os.getenv("SUBTITLE_CLIP_CACHE_SIZE", 4096))
+
+# Clips are small and short-lived, but the default $TMPDIR may sit on
+# rotating or fsync-heavy storage. On Linux, point temp files at the
+# /dev/shm tmpfs when it has comfortable headroom so the whole staging
+# pipeline stays in RAM.
+_SHM_MIN_FREE_BYTES = 1 << 30
+
+
+def _pick_tempdir() -> None:
+    """Route temp files through /dev/shm when it exists and has space."""
+    if not sys.platform.startswith("linux") or not os.path.isdir("/dev/shm"):
+        return
+    try:
+        stats = os.statvfs("/dev/shm")
+    except OSError:
+        return
+    if stats.f_bavail * stats.f_frsize >= _SHM_MIN_FREE_BYTES:
+        tempfile.tempdir = "/dev/shm"
+
+
+_pick_tempdir()
+
+_clip_cache: "OrderedDict[Tuple[str, str, str, float], str]" = OrderedDict()
+_clip_cache_lock = threading.Lock()
+_clip_cache_dir: Optional[Path] = None
+_clip_cache_counter = itertools.count()
+
+
+def _get_clip_cache_dir() -> Path:
+    """Lazily create the directory that owns cached clip files."""
+    global _clip_cache_dir
+    if _clip_cache_dir is None:
+        _clip_cache_dir = Path(tempfile.mkdtemp(prefix="subtitle_tts_cache_"))
+    return _clip_cache_dir
+
+
+def _clip_cache_get(key) -> Optional[bytes]:
+    """Look up a cached clip, refreshing its LRU position on a hit."""
+    with _clip_cache_lock:
+        path = _clip_cache.get(key)
+        if path is None:
+            return None
+        _clip_cache.move_to_end(key)
+        return Path(path).read_bytes()
+
+
+def _clip_cache_store(key, data: bytes, response_format: str) -> None:
+    """Add a freshly rendered clip to the cache, evicting the oldest entries."""
+    with _clip_cache_lock:
+        if key in _clip_cache:
+            return
+        while len(_clip_cache) >= CLIP_CACHE_SIZE:
+            _, evicted = _clip_cache.popitem(last=False)
+            Path(evicted).unlink(missing_ok=True)
+        cached_path = (
+            _get_clip_cache_dir()
+            / f"{next(_clip_cache_counter)}.{response_format}"
+        )
+        cached_path.write_bytes(data)
+        _clip_cache[key] = str(cached_path)
+
+_sanitize_pool: Optional[ProcessPoolExecutor] = None
+_sanitize_pool_lock = threading.Lock()
+
+
+def _get_sanitize_pool() -> ProcessPoolExecutor:
+    """Lazily create the shared sanitation process pool."""
+    global _sanitize_pool
+    if _sanitize_pool is None:
+        with _sanitize_pool_lock:
+            if _sanitize_pool is None:
+                _sanitize_pool = ProcessPoolExecutor(max_workers=SUBTITLE_CPU_WORKERS)
+    return _sanitize_pool
+
+# Formats that are already entropy-coded: running DEFLATE over them burns CPU
+# for essentially no size reduction, so store them as-is. WAV is raw PCM and
+# still benefits from compression.
+_PRECOMPRESSED_FORMATS = {"mp3", "opus", "aac", "flac"}
+
+# DEFLATE level for entries that do get compressed (the WAV case). On PCM
+# audio level 1 keeps roughly 95% of level 6's ratio at about a third of
+# the CPU cost; raise via env var if archive size matters more than speed.
+ZIP_COMPRESSLEVEL = int(os.getenv("SUBTITLE_ZIP_COMPRESSLEVEL", 1))
+
+
+def _compression_for_format(response_format: str) -> int:
+    """Pick the ZIP compression method appropriate for an audio format."""
+    if response_format in _PRECOMPRESSED_FORMATS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+# Tile size for CRC passes: large enough to amortize call overhead, small
+# enough that a tile stays L2-resident while libdeflate's SIMD kernel runs.
+_CRC_TILE = 256 << 10
+
+
+def _crc32_tiled(buf) -> int:
+    """CRC32 a buffer in L2-sized tiles using libdeflate's SIMD kernel."""
+    crc = 0
+    view = memoryview(buf)
+    for start in range(0, len(view), _CRC_TILE):
+        crc = deflate.crc32(view[start : start + _CRC_TILE], crc)
+    return crc
+
+
+# Classic ZIP headers hold sizes and offsets in 32 bits and entry counts in
+# 16; anything at or past these limits needs ZIP64 records.
+_ZIP64_LIMIT = 0xFFFFFFFF
+_ZIP64_ENTRY_LIMIT = 0xFFFF
+
+
+def _dos_datetime(timestamp: float) -> Tuple[int, int]:
+    """Convert a Unix timestamp to the DOS (time, date) pair used by ZIP headers."""
+    parts = time.localtime(timestamp)
+    dos_time = (parts.tm_hour << 11) | (parts.tm_min << 5) | (parts.tm_sec // 2)
+    dos_date = ((parts.tm_year - 1980) << 9) | (parts.tm_mon << 5) | parts.tm_mday
+    return dos_time, dos_date
+
+
+class _LibdeflateZipWriter:
+    """Incremental ZIP writer backed by libdeflate.
+
+    Each clip is a known-size whole buffer, which is the ideal case for
+    libdeflate's one-shot compressor. Local file headers, the central
+    directory and the end-of-central-directory record are emitted by hand
+    so the compressed stream never passes through zlib. Entries carry
+    their own compression method so pre-compressed formats are stored.
+    Entries can be appended in any completion order; the central directory
+    is accumulated in memory and flushed on close. ZIP64 records are
+    emitted when sizes, offsets or the entry count outgrow the classic
+    header fields, so multi-gigabyte jobs do not overflow.
+    """
+
+    def __init__(self, fileobj):
+        self._archive = fileobj
+        self._central_directory: List[bytes] = []
+        self._offset = 0
+        self._dos_time, self._dos_date = _dos_datetime(time.time())
+
+    def _emit_entry(
+        self, arcname: str, method: int, crc: int, size: int, csize: int, write_payload
+    ) -> None:
+        """Write the local header, payload and central-directory record.
+
+        Entries whose sizes or offset overflow the classic 32-bit header
+        fields get a ZIP64 extra field; the overflowed fields are pinned to
+        0xFFFFFFFF as the spec requires.
+        """
+        name_bytes = arcname.encode("utf-8")
+
+        zip64_local = size >= _ZIP64_LIMIT or csize >= _ZIP64_LIMIT
+        if zip64_local:
+            local_extra = struct.pack("<HHQQ", 0x0001, 16, size, csize)
+        else:
+            local_extra = b""
+        header = struct.pack(
+            "<4sHHHHHIIIHH",
+            b"PK\x03\x04",
+            45 if zip64_local else 20,  # version needed to extract
+            0,  # general purpose flags
+            method,
+            self._dos_time,
+            self._dos_date,
+            crc,
+            # The local extra always carries both sizes, so both 32-bit
+            # fields must hold the sentinel (APPNOTE 4.5.3) — readers take
+            # the extra's values positionally for every pinned field.
+            _ZIP64_LIMIT if zip64_local else csize,
+            _ZIP64_LIMIT if zip64_local else size,
+            len(name_bytes),
+            len(local_extra),
+        )
+        self._archive.write(header)
+        self._archive.write(name_bytes)
+        self._archive.write(local_extra)
+        write_payload()
+
+        # The central record's ZIP64 field carries only the values that
+        # overflowed, in the order size / csize / offset.
+        overflowed = [
+            value
+            for value in (size, csize, self._offset)
+            if value >= _ZIP64_LIMIT
+        ]
+        if overflowed:
+            central_extra = struct.pack(
+                f"<HH{len(overflowed)}Q", 0x0001, 8 * len(overflowed), *overflowed
+            )
+        else:
+            central_extra = b""
+        self._central_directory.append(
+            struct.pack(
+                "<4sHHHHHHIIIHHHHHII",
+                b"PK\x01\x02",
+                45,  # version made by
+                45 if central_extra else 20,  # version needed to extract
+                0,  # general purpose flags
+                method,
+                self._dos_time,
+                self._dos_date,
+                crc,
+                min(csize, _ZIP64_LIMIT),
+                min(size, _ZIP64_LIMIT),
+                len(name_bytes),
+                len(central_extra),  # extra field length
+                0,  # file comment length
+                0,  # disk number start
+                0,  # internal attributes
+                0,  # external attributes
+                min(self._offset, _ZIP64_LIMIT),
+            )
+            + name_bytes
+            + central_extra
+        )
+        self._offset += len(header) + len(name_bytes) + len(local_extra) + csize
+
+    def add_bytes(self, arcname: str, data: bytes, method: int) -> None:
+        crc = _crc32_tiled(data) if data else 0
+        if method == zipfile.ZIP_STORED:
+            payload = data
+        else:
+            payload = deflate.deflate_compress(data, ZIP_COMPRESSLEVEL) if data else b""
+        self._emit_entry(
+            arcname,
+            method,
+            crc,
+            len(data),
+            len(payload),
+            lambda: self._archive.write(payload),
+        )
+
+    def close(self) -> None:
+        central_start = self._offset
+        central_size = 0
+        for record in self._central_directory:
+            self._archive.write(record)
+            central_size += len(record)
+
+        entries = len(self._central_directory)
+        if (
+            entries >= _ZIP64_ENTRY_LIMIT
+            or central_start >= _ZIP64_LIMIT
+            or central_size >= _ZIP64_LIMIT
+        ):
+            # ZIP64 end-of-central-directory record plus its locator; the
+            # classic record below then carries pinned sentinel values.
+            self._archive.write(
+                struct.pack(
+                    "<4sQHHIIQQQQ",
+                    b"PK\x06\x06",
+                    44,  # size of the remainder of this record
+                    45,  # version made by
+                    45,  # version needed to extract
+                    0,  # disk number
+                    0,  # disk with central directory
+                    entries,
+                    entries,
+                    central_size,
+                    central_start,
+                )
+            )
+            self._archive.write(
+                struct.pack(
+                    "<4sIQI",
+                    b"PK\x06\x07",
+                    0,  # disk with the ZIP64 end-of-central-directory
+                    central_start + central_size,
+                    1,  # total disks
+                )
+            )
+
+        self._archive.write(
+            struct.pack(
+                "<4sHHHHIIH",
+                b"PK\x05\x06",
+                0,  # disk number
+                0,  # disk with central directory
+                min(entries, _ZIP64_ENTRY_LIMIT),
+                min(entries, _ZIP64_ENTRY_LIMIT),
+                min(central_size, _ZIP64_LIMIT),
+                min(central_start, _ZIP64_LIMIT),
+                0,  # comment length
+            )
+        )
+        self._archive.close()
+
+
+class _StdlibZipWriter:
+    """Incremental ZIP writer backed by zipfile, used when libdeflate is absent.
+
+    zipfile detects that the sink cannot seek and falls back to data
+    descriptors, so it works over the same write-only file objects as the
+    libdeflate writer.
+    """
+
+    def __init__(self, fileobj):
+        self._archive = zipfile.ZipFile(fileobj, "w", compresslevel=ZIP_COMPRESSLEVEL)
+
+    def add_bytes(self, arcname: str, data: bytes, method: int) -> None:
+        self._archive.writestr(arcname, data, compress_type=method)
+
+    def close(self) -> None:
+        self._archive.close()
+
+
+def _open_zip_writer(fileobj):
+    """Pick the fastest available incremental ZIP writer over a file object."""
+    if deflate is not None:
+        return _LibdeflateZipWriter(fileobj)
+    return _StdlibZipWriter(fileobj)
+
+
+# Upper bound on archive chunks parked between the render thread and the HTTP
+# response. A full queue blocks the writer, which in turn pauses rendering, so
+# a slow client throttles the pipeline instead of ballooning memory.
+STREAM_QUEUE_DEPTH = int(os.getenv("SUBTITLE_STREAM_QUEUE_DEPTH", 32))
+
+
+class _QueueArchiveSink:
+    """Write-only file object handing archive chunks to a bounded queue.
+
+    This is the hand-off between the render thread and the response
+    generator. Writes block while the queue is full (backpressure) and bail
+    out once the consumer is gone, so an abandoned download unwinds the
+    render instead of leaving it blocked forever.
+    """
+
+    def __init__(self, chunks: "queue.Queue", abandoned: threading.Event):
+        self._chunks = chunks
+        self._abandoned = abandoned
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        if chunk:
+            while True:
+                if self._abandoned.is_set():
+                    raise RuntimeError("archive consumer is gone")
+                try:
+                    self._chunks.put(chunk, timeout=1.0)
+                    break
+                except queue.Full:
+                    continue
+        return len(chunk)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+# One compiled pattern matches an entire subtitle block; a single finditer
+# pass over the buffer replaces srt.parse's per-block Python generator and
+# is an order of magnitude faster on multi-megabyte files.
+_SRT_BLOCK = re.compile(
+    r"(\d+)\s*\r?\n"
+    r"(\d{2}):(\d{2}):(\d{2})[,.](\d{3})\s*-->\s*"
+    r"(\d{2}):(\d{2}):(\d{2})[,.](\d{3})[^\n]*\r?\n"
+    r"(.*?)(?=\r?\n\r?\n|\Z)",
+    re.DOTALL,
+)
+
+
+def _block_timedelta(hours: str, minutes: str, seconds: str, millis: str) -> timedelta:
+    """Build a timedelta from captured SRT timestamp fields."""
+    return timedelta(
+        hours=int(hours),
+        minutes=int(minutes),
+        seconds=int(seconds),
+        milliseconds=int(millis),
+    )
+
 
 def parse_srt_content(srt_content: str) -> List[srt.Subtitle]:
-    """Parse SRT text into subtitle objects."""
-    return list(srt.parse(srt_content))
+    """Parse SRT text into subtitle objects.
 
+    Uses the single-pass regex scanner; falls back to srt.parse for inputs
+    the fast path does not recognize so odd-but-valid files still work.
+    """
+    subtitles = [
+        srt.Subtitle(
+            index=int(match.group(1)),
+            start=_block_timedelta(*match.group(2, 3, 4, 5)),
+            end=_block_timedelta(*match.group(6, 7, 8, 9)),
+            content=match.group(10).replace("\r\n", "\n").strip(),
+        )
+        for match in _SRT_BLOCK.finditer(srt_content)
+    ]
+
+    # The regex is stricter than what srt.parse accepts (e.g. it rejects
+    # three-digit hour fields), and a block it skips would silently drop a
+    # clip from the job. Cross-check the match count against the number of
+    # timestamp arrows and fall back whenever they disagree.
+    if len(subtitles) != srt_content.count("-->") and srt_content.strip():
+        return list(srt.parse(srt_content))
+    return subtitles
+
+
+async def _sanitize_async(text: str) -> str:
+    """Sanitize a line on the shared process pool without blocking the loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_sanitize_pool(), prepare_tts_input_with_context, text
+    )
+
+
+async def _transcode_chunk(buffers: List[bytes], response_format: str) -> List[bytes]:
+    """Bulk-transcode a chunk of native-format clips off the event loop.
+
+    The buffers are staged to files so transcode_clips can hand the whole
+    chunk to a single ffmpeg process, then read back and cleaned up with
+    one rmtree.
+    """
+    work_dir = Path(tempfile.mkdtemp(prefix="subtitle_tts_transcode_"))
+    try:
+        clip_paths = []
+        for position, data in enumerate(buffers):
+            clip_path = work_dir / f"{position:04d}.{NATIVE_FORMAT}"
+            clip_path.write_bytes(data)
+            clip_paths.append(str(clip_path))
+
+        loop = asyncio.get_running_loop()
+        output_paths = await loop.run_in_executor(
+            None, transcode_clips, clip_paths, response_format
+        )
+        return [Path(output_path).read_bytes() for output_path in output_paths]
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
 
-def _render_segment(
-    subtitle: srt.Subtitle,
+
+async def _render_chunk_async(
+    chunk: List[srt.Subtitle],
     voice: str,
     response_format: str,
     speed: float,
     sanitize_text: bool,
-) -> Tuple[int, str]:
-    """Render an individual subtitle line to an audio file."""
-    text = subtitle.content
+    semaphore: asyncio.Semaphore,
+    pending: Dict[Tuple[str, str, str, float], asyncio.Future],
+) -> List[Tuple[int, bytes]]:
+    """Render a chunk of subtitle lines through one batched TTS call.
+
+    Repeated lines are deduplicated at two levels: finished clips come from
+    the cross-job clip cache, while lines another chunk of this job is
+    already rendering are awaited through the job-wide `pending` futures
+    map, so each distinct line costs one TTS call no matter how often it
+    repeats within the job.
+    """
     if sanitize_text:
-        text = prepare_tts_input_with_context(text)
+        # Sanitize outside the semaphore so CPU work overlaps with in-flight
+        # network renders instead of occupying a render slot.
+        texts = list(
+            await asyncio.gather(
+                *(_sanitize_async(subtitle.content) for subtitle in chunk)
+            )
+        )
+    else:
+        texts = [subtitle.content for subtitle in chunk]
+
+    # Sort each line into: cached, rendered elsewhere in this job (await its
+    # future), or a genuine miss this chunk renders and publishes. In-chunk
+    # duplicates land in `shared` too, because the first occurrence installs
+    # the pending future before the second is examined.
+    results: List[Optional[Tuple[int, bytes]]] = [None] * len(chunk)
+    misses: List[int] = []
+    shared: List[Tuple[int, asyncio.Future]] = []
+    loop = asyncio.get_running_loop()
+    for position, (subtitle, text) in enumerate(zip(chunk, texts)):
+        key = (text, voice, response_format, speed)
+        cached = _clip_cache_get(key)
+        if cached is not None:
+            results[position] = (subtitle.index, cached)
+            continue
+        future = pending.get(key)
+        if future is not None:
+            shared.append((position, future))
+            continue
+        pending[key] = loop.create_future()
+        misses.append(position)
+
+    if misses:
+        # Generate in the backend's native format so no per-clip transcode
+        # runs inside the TTS layer; non-native formats are converted below
+        # in one bulk ffmpeg pass per chunk. The semaphore is threaded down
+        # so each line holds a render slot individually — wrapping the whole
+        # batch here would multiply the bound by the chunk size.
+        try:
+            buffers = await generate_speech_bytes_batch_async(
+                [texts[position] for position in misses],
+                voice,
+                NATIVE_FORMAT,
+                speed,
+                semaphore=semaphore,
+            )
+            if response_format != NATIVE_FORMAT:
+                buffers = await _transcode_chunk(buffers, response_format)
+        except Exception as exc:
+            # Fail the published futures so chunks waiting on our lines see
+            # the same error instead of hanging; .exception() marks the
+            # failure retrieved for futures nobody happens to share.
+            for position in misses:
+                future = pending.pop((texts[position], voice, response_format, speed))
+                future.set_exception(exc)
+                future.exception()
+            raise
+        for position, data in zip(misses, buffers):
+            key = (texts[position], voice, response_format, speed)
+            results[position] = (chunk[position].index, data)
+            _clip_cache_store(key, data, response_format)
+            pending.pop(key).set_result(data)
 
-    output_path = generate_speech(text, voice, response_format, speed)
-    return subtitle.index, output_path
+    for position, future in shared:
+        results[position] = (chunk[position].index, await future)
 
+    return [result for result in results if result is not None]
 
-def render_subtitles_to_zip(
+
+async def _render_chunk_guarded(
+    chunk: List[srt.Subtitle],
+    voice: str,
+    response_format: str,
+    speed: float,
+    sanitize_text: bool,
+    semaphore: asyncio.Semaphore,
+    pending: Dict[Tuple[str, str, str, float], asyncio.Future],
+):
+    """Render a chunk, returning (chunk, results-or-exception) as a sentinel.
+
+    Returning the failure instead of raising keeps the fan-out loop free of
+    per-task exception plumbing and lets all chunks share one code path.
+    """
+    try:
+        return chunk, await _render_chunk_async(
+            chunk, voice, response_format, speed, sanitize_text, semaphore, pending
+        )
+    except Exception as exc:
+        return chunk, exc
+
+
+async def _render_all(
+    subtitles: List[srt.Subtitle],
+    voice: str,
+    response_format: str,
+    speed: float,
+    sanitize_text: bool,
+    max_workers: int,
+    writer,
+) -> Tuple[int, List[str]]:
+    """Render every subtitle concurrently and archive clips as they finish.
+
+    The zip writer is I/O-bound while the TTS tasks are network-bound, so
+    writing each chunk the moment it completes hides the archive write
+    time entirely behind generation and caps buffered clips at the chunks
+    currently in flight. Entries land in completion order, which ZIP
+    permits (the central directory is built in memory) and which readers
+    are insensitive to because every entry is named by its subtitle index.
+    The single event loop serialises `writer.add_bytes` calls, so no lock
+    is needed around the non-thread-safe archive.
+    """
+    semaphore = asyncio.Semaphore(max_workers)
+    method = _compression_for_format(response_format)
+
+    # Job-wide map of lines currently rendering, so duplicates spread across
+    # chunks wait for the first render instead of paying their own TTS call.
+    pending: Dict[Tuple[str, str, str, float], asyncio.Future] = {}
+
+    # Longest-first submission (the classic LPT heuristic): heavyweight lines
+    # start early instead of straggling at the end and stalling the archive.
+    ordered = sorted(subtitles, key=lambda subtitle: len(subtitle.content), reverse=True)
+    chunks = [
+        ordered[start : start + BATCH_SIZE]
+        for start in range(0, len(ordered), BATCH_SIZE)
+    ]
+
+    clip_count = 0
+    errors: List[str] = []
+    for task in asyncio.as_completed(
+        [
+            _render_chunk_guarded(
+                chunk, voice, response_format, speed, sanitize_text, semaphore, pending
+            )
+            for chunk in chunks
+        ]
+    ):
+        chunk, outcome = await task
+        if isinstance(outcome, Exception):
+            # Chunks are built from the length-sorted order, so their members
+            # are neither contiguous nor index-ordered; report index and time
+            # bounds rather than the positional first/last members.
+            indices = sorted(subtitle.index for subtitle in chunk)
+            error_message = (
+                f"Failed to render subtitles {indices[0]}-{indices[-1]} "
+                f"({min(subtitle.start for subtitle in chunk)} -> "
+                f"{max(subtitle.end for subtitle in chunk)}): {outcome}"
+            )
+            errors.append(error_message)
+            if DETAILED_ERROR_LOGGING:
+                print(error_message)
+        else:
+            for index, data in sorted(outcome):
+                writer.add_bytes(f"{index:04d}.{response_format}", data, method)
+                clip_count += 1
+
+    return clip_count, errors
+
+
+def render_subtitles_to_zip_stream(
     subtitles: Iterable[srt.Subtitle],
     voice: str,
     response_format: str,
     speed: float,
     sanitize_text: bool = True,
     max_workers: int = DEFAULT_WORKERS,
-) -> Tuple[str, int]:
-    """Generate audio for each subtitle concurrently and package into a zip.
+):
+    """Generate audio for each subtitle and stream a zip while rendering.
 
-    Returns the path to the zip archive and the number of generated clips.
+    The archive is never materialized: rendering runs on a worker thread
+    and archive bytes reach the returned generator through a bounded
+    queue, so the first entries go out while later lines are still
+    rendering and peak memory stays near one batch of clips rather than
+    the whole job. Returns the byte-chunk generator plus the number of
+    lines scheduled. A render failure after streaming has begun is raised
+    from the generator, aborting the transfer mid-stream.
     """
+    subtitles = list(subtitles)
+    chunks: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=STREAM_QUEUE_DEPTH)
+    abandoned = threading.Event()
+    failures: List[BaseException] = []
 
-    results: List[Tuple[int, str]] = []
-    errors: List[str] = []
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_map = {
-            executor.submit(
-                _render_segment, subtitle, voice, response_format, speed, sanitize_text
-            ): subtitle
-            for subtitle in subtitles
-        }
-
-        for future in as_completed(future_map):
-            subtitle = future_map[future]
-            try:
-                index, path = future.result()
-                results.append((index, path))
-            except Exception as exc:  # pragma: no cover - logging path
-                error_message = (
-                    f"Failed to render subtitle {subtitle.index} "
-                    f"({subtitle.start} -> {subtitle.end}): {exc}"
+    def produce() -> None:
+        writer = _open_zip_writer(_QueueArchiveSink(chunks, abandoned))
+        try:
+            _, errors = asyncio.run(
+                _render_all(
+                    subtitles,
+                    voice,
+                    response_format,
+                    speed,
+                    sanitize_text,
+                    max_workers,
+                    writer,
                 )
-                errors.append(error_message)
-                if DETAILED_ERROR_LOGGING:
-                    print(error_message)
-
-    if errors:
-        raise RuntimeError("; ".join(errors))
-
-    zip_path = tempfile.NamedTemporaryFile(delete=False, suffix=".zip").name
-    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-        for index, path in sorted(results, key=lambda item: item[0]):
-            clip_path = Path(path)
-            arcname = f"{index:04d}.{response_format}"
-            archive.write(clip_path, arcname=arcname)
-            clip_path.unlink(missing_ok=True)
-
-    return zip_path, len(results)
+            )
+            if errors:
+                # Leave the archive unterminated: a truncated download is a
+                # clearer failure than one that looks complete but is short
+                # some clips.
+                raise RuntimeError("; ".join(errors))
+            writer.close()
+        except BaseException as exc:
+            failures.append(exc)
+        finally:
+            while not abandoned.is_set():
+                try:
+                    chunks.put(None, timeout=1.0)
+                    break
+                except queue.Full:
+                    continue
+
+    worker = threading.Thread(target=produce, name="subtitle-zip-stream", daemon=True)
+    worker.start()
+
+    def stream_chunks():
+        try:
+            while True:
+                chunk = chunks.get()
+                if chunk is None:
+                    break
+                yield chunk
+            worker.join()
+            if failures:
+                raise failures[0]
+        finally:
+            # Reached on normal completion, mid-stream failure, or the WSGI
+            # layer closing the generator after a client disconnect; in the
+            # latter case it unblocks and unwinds the render thread.
+            abandoned.set()
+
+    return stream_chunks(), len(subtitles)
 
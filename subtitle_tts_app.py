@@ -145,13 +145,17 @@ class SubtitleTTSApp(tk.Tk):
                         'max_workers': str(self.max_workers.get()),
                     },
                     timeout=120,
+                    stream=True,
                 )
 
             response.raise_for_status()
 
+            # Stream the zip to disk in 1 MB chunks; response.content would
+            # buffer the whole bundle in memory before the first write.
             output_path = os.path.join(self.output_dir.get(), 'subtitle_audio.zip')
             with open(output_path, 'wb') as outfile:
-                outfile.write(response.content)
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    outfile.write(chunk)
 
             self.status_text.set(f"Saved audio bundle to {output_path}")
         except Exception as exc:
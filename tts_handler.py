@@ -3,6 +3,7 @@
 import edge_tts
 import asyncio
 import tempfile
+import threading
 import subprocess
 import os
 from pathlib import Path
@@ -34,6 +35,53 @@ model_data = [
         {"id": "gpt-4o-mini-tts", "name": "GPT-4o mini TTS"}
     ]
 
+# edge-tts emits mp3; every other response_format costs an ffmpeg transcode.
+NATIVE_FORMAT = "mp3"
+
+# How many clips share one ffmpeg process in transcode_clips; bounds the
+# command-line length while still amortizing process/codec startup.
+TRANSCODE_GROUP_SIZE = 32
+
+_FFMPEG_CODECS = {
+    "aac": "aac",
+    "mp3": "libmp3lame",
+    "wav": "pcm_s16le",
+    "opus": "libopus",
+    "flac": "flac"
+}
+
+_FFMPEG_FORMATS = {
+    "aac": "mp4",  # AAC in MP4 container
+    "mp3": "mp3",
+    "wav": "wav",
+    "opus": "ogg",
+    "flac": "flac"
+}
+
+# A single long-lived event loop shared by the synchronous wrappers. Spinning
+# up a fresh loop per call (asyncio.run) rebuilds the loop, its selector and
+# the TTS client's connection state every time; reusing one amortizes that
+# setup across high call-frequency workloads.
+_event_loop = None
+_event_loop_lock = threading.Lock()
+
+def _get_event_loop():
+    """Return the shared background event loop, starting it on first use."""
+    global _event_loop
+    if _event_loop is None:
+        with _event_loop_lock:
+            if _event_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="tts-event-loop", daemon=True
+                ).start()
+                _event_loop = loop
+    return _event_loop
+
+def _run_sync(coro):
+    """Run a coroutine on the shared loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_event_loop()).result()
+
 def is_ffmpeg_installed():
     """Check if FFmpeg is installed and accessible."""
     try:
@@ -105,26 +153,14 @@ async def _generate_audio(text, voice, response_format, speed):
     ffmpeg_command = [
         "ffmpeg",
         "-i", temp_mp3_path,  # Input file path
-        "-c:a", {
-            "aac": "aac",
-            "mp3": "libmp3lame",
-            "wav": "pcm_s16le",
-            "opus": "libopus",
-            "flac": "flac"
-        }.get(response_format, "aac"),  # Default to AAC if unknown
+        "-c:a", _FFMPEG_CODECS.get(response_format, "aac"),  # Default to AAC if unknown
     ]
 
     if response_format != "wav":
         ffmpeg_command.extend(["-b:a", "192k"])
 
     ffmpeg_command.extend([
-        "-f", {
-            "aac": "mp4",  # AAC in MP4 container
-            "mp3": "mp3",
-            "wav": "wav",
-            "opus": "ogg",
-            "flac": "flac"
-        }.get(response_format, response_format),  # Default to matching format
+        "-f", _FFMPEG_FORMATS.get(response_format, response_format),  # Default to matching format
         "-y",  # Overwrite without prompt
         converted_path  # Output file path
     ])
@@ -152,7 +188,100 @@ async def _generate_audio(text, voice, response_format, speed):
     return converted_path
 
 def generate_speech(text, voice, response_format, speed=1.0):
-    return asyncio.run(_generate_audio(text, voice, response_format, speed))
+    return _run_sync(_generate_audio(text, voice, response_format, speed))
+
+async def _generate_audio_bytes(text, voice, response_format, speed):
+    """Generate TTS audio fully in memory, skipping the temp-file roundtrip."""
+    if response_format == "mp3":
+        # The backend emits mp3 natively; collect the stream chunks directly
+        # instead of saving to a file and reading it back.
+        audio = bytearray()
+        async for chunk in _generate_audio_stream(text, voice, speed):
+            audio += chunk
+        return bytes(audio)
+
+    # Other formats still pass through the ffmpeg conversion on disk; read
+    # the result back and drop the temp file.
+    output_path = await _generate_audio(text, voice, response_format, speed)
+    data = Path(output_path).read_bytes()
+    Path(output_path).unlink(missing_ok=True)
+    return data
+
+async def generate_speech_bytes_batch_async(texts, voice, response_format, speed=1.0, semaphore=None):
+    """Render a batch of texts to in-memory audio buffers, in input order.
+
+    When a semaphore is given, each render acquires it individually, so a
+    caller's concurrency bound counts in-flight lines rather than whole
+    batches.
+    """
+    async def render(text):
+        if semaphore is None:
+            return await _generate_audio_bytes(text, voice, response_format, speed)
+        async with semaphore:
+            return await _generate_audio_bytes(text, voice, response_format, speed)
+
+    return list(await asyncio.gather(*(render(text) for text in texts)))
+
+def _transcode_group_command(inputs, outputs, response_format):
+    """Build one ffmpeg command that transcodes N inputs to N outputs."""
+    command = ["ffmpeg"]
+    for input_path in inputs:
+        command.extend(["-i", input_path])
+
+    codec = _FFMPEG_CODECS.get(response_format, "aac")
+    container = _FFMPEG_FORMATS.get(response_format, response_format)
+    for position, output_path in enumerate(outputs):
+        command.extend(["-map", f"{position}:a", "-c:a", codec])
+        if response_format != "wav":
+            command.extend(["-b:a", "192k"])
+        command.extend(["-f", container, "-y", output_path])
+    return command
+
+def transcode_clips(clip_paths, response_format):
+    """Bulk-transcode native-format clips to response_format.
+
+    Clips are grouped so each ffmpeg invocation handles many inputs and
+    mapped outputs, paying process and codec startup once per group rather
+    than once per clip; the groups run as concurrent processes. Returns
+    the output paths in input order. If ffmpeg is unavailable the clips
+    are returned unmodified, matching _generate_audio's fallback.
+    """
+    if response_format == NATIVE_FORMAT or not clip_paths:
+        return list(clip_paths)
+
+    if not is_ffmpeg_installed():
+        print("FFmpeg is not available. Returning unmodified clips.")
+        return list(clip_paths)
+
+    output_paths = [
+        str(Path(clip_path).with_suffix(f".{response_format}"))
+        for clip_path in clip_paths
+    ]
+
+    processes = []
+    for start in range(0, len(clip_paths), TRANSCODE_GROUP_SIZE):
+        command = _transcode_group_command(
+            clip_paths[start:start + TRANSCODE_GROUP_SIZE],
+            output_paths[start:start + TRANSCODE_GROUP_SIZE],
+            response_format,
+        )
+        processes.append(subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE))
+
+    failures = []
+    for process in processes:
+        _, stderr = process.communicate()
+        if process.returncode != 0:
+            if DETAILED_ERROR_LOGGING:
+                failures.append(stderr.decode('utf-8', 'ignore'))
+            else:
+                failures.append(f"exit code {process.returncode}")
+
+    if failures:
+        error_message = f"FFmpeg error during bulk transcode: {'; '.join(failures)}"
+        print(error_message)
+        raise RuntimeError(error_message)
+
+    return output_paths
 
 def get_models():
     return model_data
@@ -174,7 +303,7 @@ async def _get_voices(language=None):
     return filtered_voices
 
 def get_voices(language=None):
-    return asyncio.run(_get_voices(language))
+    return _run_sync(_get_voices(language))
 
 def speed_to_rate(speed: float) -> str:
     """